@@ -1,25 +1,118 @@
-from flask import Flask, request, jsonify, render_template
-from robot_simulator import RobotSimulator  
+import logging
+import re
+import threading
+from pathlib import Path
+
+from flask import Flask, Response, request, jsonify
+from robot_simulator import RobotSimulator, RobotSimulatorError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # optional; stdlib json is used when unavailable
+
+# Keep the simulator's informational messages silent on the request path;
+# raise to INFO to debug command handling.
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
+if orjson is not None:
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """JSON provider backed by orjson's C encoder/decoder"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
 robot = RobotSimulator(grid_width=5, grid_height=5)
 
+# The robot is shared mutable state; serialize mutations so the app can
+# run under a threaded WSGI server.
+robot_lock = threading.Lock()
+
+# Per-thread scratch envelope for success responses; reused across
+# requests so the steady-state /command path allocates no dicts
+# (report() already returns the robot's persistent status dict).
+_tls = threading.local()
+
+# Shape of every accepted command: a known verb plus at most two
+# arguments. Matching here rejects malformed input in C-level regex code
+# before the robot lock is taken or any simulator state is touched.
+_CMD_RE = re.compile(
+    r"^(forward|f|left|l|right|r|diagonal|d|report|charge|grid|reset|obstacle)"
+    r"(?:\s+(\S+))?(?:\s+(\S+))?$",
+    re.IGNORECASE,
+)
+
+# index.html is a static shell with no template variables; read it once
+# at import and serve the bytes directly.
+_INDEX_HTML = (Path(__file__).parent / 'index.html').read_bytes()
+
 @app.route('/')
 def index():
-    return render_template('index.html') 
+    return Response(_INDEX_HTML, mimetype='text/html')
+
+@app.errorhandler(RobotSimulatorError)
+def handle_simulator_error(e):
+    # Single place where failed commands are logged and turned into an
+    # error payload; the simulator raises without logging on its own.
+    logger.warning(str(e))
+    return jsonify({'status': 'error', 'message': str(e)}), 400
 
 @app.route('/command', methods=['POST'])
 def command():
+    """
+    Execute one command ({"command": "forward 2"}) or a batch
+    ({"commands": ["forward 2", "right", "forward"]}). A batch runs
+    under one lock acquisition and returns a single status report,
+    amortizing the per-request overhead over all commands.
+    """
     data = request.json
-    cmd = data.get('command', '')
+    cmds = data.get('commands')
+    if cmds is None:
+        cmds = [data.get('command', '')]
+    elif not isinstance(cmds, list):
+        return jsonify({'status': 'error',
+                        'message': 'commands must be a list of strings'}), 400
 
-    try:
-        robot.execute_command(cmd)
-        status = robot.report()
-        return jsonify({'status': 'success', 'data': status})
-    except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)})
+    cmds = [str(c).strip() for c in cmds]
+    for c in cmds:
+        if not _CMD_RE.match(c):
+            return jsonify({'status': 'error',
+                            'message': f'Invalid command format: {c}'}), 400
+
+    with robot_lock:
+        for executed, c in enumerate(cmds):
+            try:
+                robot.execute_command(c)
+            except RobotSimulatorError as e:
+                # Stop at the first failure; earlier commands keep their
+                # effects and the client learns where the batch broke.
+                logger.warning(str(e))
+                return jsonify({'status': 'error', 'message': str(e),
+                                'failed_command': c,
+                                'executed': executed}), 400
+        # Serialize while still holding the lock: report() returns the
+        # robot's persistent status dict, which other requests may mutate.
+        resp = getattr(_tls, 'resp', None)
+        if resp is None:
+            resp = _tls.resp = {'status': 'success', 'data': None}
+        resp['data'] = robot.report()
+        return jsonify(resp)
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    try:
+        from waitress import serve
+    except ImportError:
+        # Fall back to the single-threaded dev server
+        app.run(debug=True)
+    else:
+        serve(app, host='127.0.0.1', port=5000, threads=8)
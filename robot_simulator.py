@@ -1,6 +1,10 @@
-import random
+import functools
+import logging
+from collections import deque
 from enum import Enum
-from typing import List, Tuple, Optional, Dict
+from typing import Deque, Tuple, Optional, Dict
+
+logger = logging.getLogger(__name__)
 
 class Direction(Enum):
     """Enumeration for robot directions"""
@@ -9,6 +13,59 @@ class Direction(Enum):
     SOUTH = 2
     WEST = 3
 
+# Direction tables indexed by the robot's integer heading (0-3). Plain
+# tuples avoid the Enum constructor and dict hashing on every turn/move.
+_DIR_VECS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+_DIR_NAMES = ("NORTH", "EAST", "SOUTH", "WEST")
+_DIR_SYMBOLS = ("↑", "→", "↓", "←")
+
+# Diagonal direction vectors, shared by all instances
+_DIAG_VECS = {
+    'northeast': (1, 1),
+    'southeast': (1, -1),
+    'southwest': (-1, -1),
+    'northwest': (-1, 1),
+}
+
+# Pre-rendered grid cells so drawing is a lookup plus one join per row
+_CELL_EMPTY = " . "
+_CELL_OBSTACLE = " # "
+_CELL_ROBOT = tuple(f" {s} " for s in _DIR_SYMBOLS)
+
+# Status codes returned by _walk
+_WALK_OK = 0
+_WALK_OUT_OF_BOUNDS = 1
+_WALK_OBSTACLE = 2
+
+def _walk(x: int, y: int, dx: int, dy: int, steps: int,
+          obstacle_mask: int, width: int, height: int) -> Tuple[int, int, int]:
+    """
+    Step from (x, y) along (dx, dy), checking every cell on the path
+    against the grid bounds and the obstacle bitset. Returns the final
+    (or offending) position and a _WALK_* status code.
+    """
+    for _ in range(steps):
+        x += dx
+        y += dy
+        if not (0 <= x < width and 0 <= y < height):
+            return x, y, _WALK_OUT_OF_BOUNDS
+        if obstacle_mask >> (y * width + x) & 1:
+            return x, y, _WALK_OBSTACLE
+    return x, y, _WALK_OK
+
+@functools.lru_cache(maxsize=128)
+def _parse(command: str) -> Tuple[str, ...]:
+    """
+    Split a raw command string into a (verb, args...) tuple with the
+    verb lowercased. Cached because web clients tend to repeat the same
+    few command strings, so steady-state traffic skips parsing entirely.
+    """
+    parts = command.split()
+    if not parts:
+        raise InvalidCommandError("Empty command")
+    parts[0] = parts[0].lower()
+    return tuple(parts)
+
 class RobotSimulatorError(Exception):
     """Custom exception for robot simulator errors"""
     pass
@@ -42,7 +99,16 @@ class RobotSimulator:
     - Grid expansion
     - Command history
     """
-    
+
+    # Fixed attribute layout: no per-instance __dict__, faster attribute
+    # access on the hot command paths
+    __slots__ = (
+        "x", "y", "dir", "grid_width", "grid_height", "battery_level",
+        "expandable_grid", "obstacle_mask", "obstacle_count",
+        "command_history", "move_count", "_cmd_tick",
+        "_status_dict", "_cached_report", "_dirty", "_base_cells",
+    )
+
     def __init__(self, grid_width: int = 5, grid_height: int = 5, 
                  battery_level: int = 100, expandable_grid: bool = False):
         """
@@ -56,60 +122,103 @@ class RobotSimulator:
         """
         self.x = 0
         self.y = 0
-        self.direction = Direction.NORTH
+        self.dir = 0  # integer heading, index into _DIR_VECS/_DIR_NAMES
         self.grid_width = grid_width
         self.grid_height = grid_height
         self.battery_level = max(0, min(100, battery_level))
         self.expandable_grid = expandable_grid
-        self.obstacles: set = set()
-        self.command_history: List[str] = []
+        # Obstacles are stored as a packed bitset: bit (y * grid_width + x)
+        # is set when the cell holds an obstacle. This keeps collision checks
+        # a single bit test with no tuple allocation or hashing.
+        self.obstacle_mask = 0
+        self.obstacle_count = 0
+        # Bounded so a long-lived server cannot grow history without limit
+        self.command_history: Deque[str] = deque(maxlen=1024)
         self.move_count = 0
-        
-        # Direction vectors for movement
-        self.direction_vectors = {
-            Direction.NORTH: (0, 1),
-            Direction.EAST: (1, 0),
-            Direction.SOUTH: (0, -1),
-            Direction.WEST: (-1, 0)
-        }
-        
-        # Diagonal direction vectors
-        self.diagonal_vectors = {
-            'northeast': (1, 1),
-            'southeast': (1, -1),
-            'southwest': (-1, -1),
-            'northwest': (-1, 1)
+        self._cmd_tick = 0  # counts commands for the ambient battery drain
+
+        # report() reuses one status dict for the life of the instance,
+        # refreshing its values in place when the dirty flag is set; idle
+        # polling is allocation-free and mutation refreshes cost no new
+        # dict. The formatted status string is cached alongside it.
+        self._status_dict: Dict = {
+            'x': self.x,
+            'y': self.y,
+            'direction': _DIR_NAMES[self.dir],
+            'battery': self.battery_level,
+            'grid_size': (self.grid_width, self.grid_height),
+            'moves': self.move_count,
+            'obstacles': self.obstacle_count
         }
+        self._cached_report: Optional[str] = None
+        self._dirty = True
+
+        # Row-major cache of empty/obstacle cell strings for render_grid;
+        # None means it needs rebuilding after an obstacle or grid change
+        self._base_cells: Optional[list] = None
         
-        print(f"Robot initialized at ({self.x}, {self.y}) facing {self.direction.name}")
-        print(f"Grid size: {self.grid_width}x{self.grid_height}")
-        print(f"Battery level: {self.battery_level}%")
-    
+        logger.info(f"Robot initialized at ({self.x}, {self.y}) facing {_DIR_NAMES[self.dir]}")
+        logger.info(f"Grid size: {self.grid_width}x{self.grid_height}")
+        logger.info(f"Battery level: {self.battery_level}%")
+
+    @property
+    def direction(self) -> Direction:
+        """Current heading as a Direction enum (kept for compatibility;
+        hot paths use the integer `dir` directly)"""
+        return Direction(self.dir)
+
+    @direction.setter
+    def direction(self, value: Direction):
+        self.dir = value.value
+
     def _consume_battery(self, amount: int = 1):
         """Consume battery for operations"""
         if self.battery_level <= 0:
             raise BatteryDeadError("Robot battery is dead! Cannot perform actions.")
         
         self.battery_level = max(0, self.battery_level - amount)
+        self._dirty = True
         if self.battery_level == 0:
-            print("Warning: Battery critically low!")
+            logger.warning("Battery critically low!")
     
     def _is_valid_position(self, x: int, y: int) -> bool:
         """Check if position is within grid boundaries"""
         return 0 <= x < self.grid_width and 0 <= y < self.grid_height
-    
+
+    def _bit(self, x: int, y: int) -> int:
+        """Return the obstacle bitset mask for cell (x, y)"""
+        return 1 << (y * self.grid_width + x)
+
+    def _remap_obstacles(self, old_width: int):
+        """Re-pack the obstacle bitset after the grid width changes"""
+        if old_width == self.grid_width or self.obstacle_mask == 0:
+            return
+
+        old_mask = self.obstacle_mask
+        new_mask = 0
+        while old_mask:
+            lsb = old_mask & -old_mask
+            y, x = divmod(lsb.bit_length() - 1, old_width)
+            new_mask |= 1 << (y * self.grid_width + x)
+            old_mask ^= lsb
+        self.obstacle_mask = new_mask
+
     def _expand_grid_if_needed(self, x: int, y: int):
         """Expand grid if expandable_grid is enabled and position is outside"""
         if not self.expandable_grid:
             return
-        
+
         if x >= self.grid_width:
+            old_width = self.grid_width
             self.grid_width = x + 1
-            print(f"Grid expanded! New width: {self.grid_width}")
-        
+            self._remap_obstacles(old_width)
+            self._base_cells = None
+            logger.info(f"Grid expanded! New width: {self.grid_width}")
+
         if y >= self.grid_height:
             self.grid_height = y + 1
-            print(f"Grid expanded! New height: {self.grid_height}")
+            self._base_cells = None
+            logger.info(f"Grid expanded! New height: {self.grid_height}")
     
     def forward(self, steps: int = 1):
         """
@@ -118,56 +227,47 @@ class RobotSimulator:
         Args:
             steps: Number of steps to move forward
         """
-        try:
-            self._consume_battery(steps)
-            
-            dx, dy = self.direction_vectors[self.direction]
-            new_x = self.x + (dx * steps)
-            new_y = self.y + (dy * steps)
-            
-            # Check for expandable grid
-            if self.expandable_grid:
-                self._expand_grid_if_needed(new_x, new_y)
-            
-            # Check boundaries
-            if not self._is_valid_position(new_x, new_y):
-                raise OutOfBoundsError(
-                    f"Cannot move to ({new_x}, {new_y}) - outside grid boundaries "
-                    f"({self.grid_width}x{self.grid_height})"
-                )
-            
-            # Check for obstacles
-            if (new_x, new_y) in self.obstacles:
-                raise ObstacleError(f"Cannot move to ({new_x}, {new_y}) - obstacle present!")
-            
-            self.x, self.y = new_x, new_y
-            self.move_count += steps
-            
-            print(f"Moved forward {steps} step(s) to ({self.x}, {self.y})")
-            
-        except (OutOfBoundsError, ObstacleError, BatteryDeadError) as e:
-            print(f"Error: {e}")
-            raise
-    
+        self._consume_battery(steps)
+
+        dx, dy = _DIR_VECS[self.dir]
+
+        # Check for expandable grid
+        if self.expandable_grid:
+            self._expand_grid_if_needed(self.x + dx * steps, self.y + dy * steps)
+
+        # Walk the path cell by cell so intermediate obstacles and
+        # boundary crossings are caught, not just the final cell
+        new_x, new_y, status = _walk(
+            self.x, self.y, dx, dy, steps,
+            self.obstacle_mask, self.grid_width, self.grid_height
+        )
+        if status == _WALK_OUT_OF_BOUNDS:
+            raise OutOfBoundsError(
+                f"Cannot move to ({new_x}, {new_y}) - outside grid boundaries "
+                f"({self.grid_width}x{self.grid_height})"
+            )
+        if status == _WALK_OBSTACLE:
+            raise ObstacleError(f"Cannot move to ({new_x}, {new_y}) - obstacle present!")
+
+        self.x, self.y = new_x, new_y
+        self.move_count += steps
+        self._dirty = True
+
+        logger.info(f"Moved forward {steps} step(s) to ({self.x}, {self.y})")
+
     def left(self):
         """Turn the robot left (counter-clockwise)"""
-        try:
-            self._consume_battery()
-            self.direction = Direction((self.direction.value - 1) % 4)
-            print(f"Turned left, now facing {self.direction.name}")
-        except BatteryDeadError as e:
-            print(f"Error: {e}")
-            raise
-    
+        self._consume_battery()
+        self.dir = (self.dir - 1) & 3
+        self._dirty = True
+        logger.info(f"Turned left, now facing {_DIR_NAMES[self.dir]}")
+
     def right(self):
         """Turn the robot right (clockwise)"""
-        try:
-            self._consume_battery()
-            self.direction = Direction((self.direction.value + 1) % 4)
-            print(f"Turned right, now facing {self.direction.name}")
-        except BatteryDeadError as e:
-            print(f"Error: {e}")
-            raise
+        self._consume_battery()
+        self.dir = (self.dir + 1) & 3
+        self._dirty = True
+        logger.info(f"Turned right, now facing {_DIR_NAMES[self.dir]}")
     
     def diagonal(self, direction: str):
         """
@@ -176,65 +276,63 @@ class RobotSimulator:
         Args:
             direction: One of 'northeast', 'southeast', 'southwest', 'northwest'
         """
-        try:
-            direction = direction.lower()
-            if direction not in self.diagonal_vectors:
-                raise InvalidCommandError(
-                    f"Invalid diagonal direction: {direction}. "
-                    f"Valid options: {list(self.diagonal_vectors.keys())}"
-                )
-            
-            self._consume_battery(2)  # Diagonal moves cost more battery
-            
-            dx, dy = self.diagonal_vectors[direction]
-            new_x = self.x + dx
-            new_y = self.y + dy
-            
-            # Check for expandable grid
-            if self.expandable_grid:
-                self._expand_grid_if_needed(new_x, new_y)
-            
-            # Check boundaries
-            if not self._is_valid_position(new_x, new_y):
-                raise OutOfBoundsError(
-                    f"Cannot move diagonally to ({new_x}, {new_y}) - outside grid boundaries"
-                )
-            
-            # Check for obstacles
-            if (new_x, new_y) in self.obstacles:
-                raise ObstacleError(f"Cannot move to ({new_x}, {new_y}) - obstacle present!")
-            
-            self.x, self.y = new_x, new_y
-            self.move_count += 1
-            
-            print(f"Moved diagonally {direction} to ({self.x}, {self.y})")
-            
-        except (InvalidCommandError, OutOfBoundsError, ObstacleError, BatteryDeadError) as e:
-            print(f"Error: {e}")
-            raise
+        direction = direction.lower()
+        if direction not in _DIAG_VECS:
+            raise InvalidCommandError(
+                f"Invalid diagonal direction: {direction}. "
+                f"Valid options: {list(_DIAG_VECS.keys())}"
+            )
+
+        self._consume_battery(2)  # Diagonal moves cost more battery
+
+        dx, dy = _DIAG_VECS[direction]
+
+        # Check for expandable grid
+        if self.expandable_grid:
+            self._expand_grid_if_needed(self.x + dx, self.y + dy)
+
+        new_x, new_y, status = _walk(
+            self.x, self.y, dx, dy, 1,
+            self.obstacle_mask, self.grid_width, self.grid_height
+        )
+        if status == _WALK_OUT_OF_BOUNDS:
+            raise OutOfBoundsError(
+                f"Cannot move diagonally to ({new_x}, {new_y}) - outside grid boundaries"
+            )
+        if status == _WALK_OBSTACLE:
+            raise ObstacleError(f"Cannot move to ({new_x}, {new_y}) - obstacle present!")
+
+        self.x, self.y = new_x, new_y
+        self.move_count += 1
+        self._dirty = True
+
+        logger.info(f"Moved diagonally {direction} to ({self.x}, {self.y})")
     
     def report(self):
         """Report the current position and status of the robot"""
-        status = f"""
+        if self._dirty or self._cached_report is None:
+            self._cached_report = f"""
 === ROBOT STATUS REPORT ===
 Position: ({self.x}, {self.y})
-Facing: {self.direction.name}
+Facing: {_DIR_NAMES[self.dir]}
 Battery Level: {self.battery_level}%
 Grid Size: {self.grid_width}x{self.grid_height}
 Total Moves: {self.move_count}
-Obstacles: {len(self.obstacles)} present
+Obstacles: {self.obstacle_count} present
 Commands Executed: {len(self.command_history)}
 ========================"""
-        print(status)
-        return {
-            'x': self.x,
-            'y': self.y,
-            'direction': self.direction.name,
-            'battery': self.battery_level,
-            'grid_size': (self.grid_width, self.grid_height),
-            'moves': self.move_count,
-            'obstacles': len(self.obstacles)
-        }
+            sd = self._status_dict
+            sd['x'] = self.x
+            sd['y'] = self.y
+            sd['direction'] = _DIR_NAMES[self.dir]
+            sd['battery'] = self.battery_level
+            sd['grid_size'] = (self.grid_width, self.grid_height)
+            sd['moves'] = self.move_count
+            sd['obstacles'] = self.obstacle_count
+            self._dirty = False
+
+        logger.info(self._cached_report)
+        return self._status_dict
     
     def add_obstacle(self, x: int, y: int):
         """Add an obstacle to the grid"""
@@ -244,127 +342,186 @@ Commands Executed: {len(self.command_history)}
         if (x, y) == (self.x, self.y):
             raise ObstacleError("Cannot place obstacle on robot's current position")
         
-        self.obstacles.add((x, y))
-        print(f"Obstacle added at ({x}, {y})")
-    
+        bit = self._bit(x, y)
+        if not self.obstacle_mask & bit:
+            self.obstacle_mask |= bit
+            self.obstacle_count += 1
+            self._dirty = True
+            self._base_cells = None
+        logger.info(f"Obstacle added at ({x}, {y})")
+
     def remove_obstacle(self, x: int, y: int):
         """Remove an obstacle from the grid"""
-        if (x, y) in self.obstacles:
-            self.obstacles.remove((x, y))
-            print(f"Obstacle removed from ({x}, {y})")
+        if not self._is_valid_position(x, y):
+            # Out-of-grid coordinates can hold no obstacle; bail out
+            # before computing a bit index that could alias a real cell
+            logger.info(f"No obstacle at ({x}, {y}) to remove")
+            return
+
+        bit = self._bit(x, y)
+        if self.obstacle_mask & bit:
+            self.obstacle_mask &= ~bit
+            self.obstacle_count -= 1
+            self._dirty = True
+            self._base_cells = None
+            logger.info(f"Obstacle removed from ({x}, {y})")
         else:
-            print(f"No obstacle at ({x}, {y}) to remove")
+            logger.info(f"No obstacle at ({x}, {y}) to remove")
     
     def charge_battery(self, amount: int = 50):
         """Charge the robot's battery"""
         old_level = self.battery_level
         self.battery_level = min(100, self.battery_level + amount)
         gained = self.battery_level - old_level
-        print(f"Battery charged! Gained {gained}% (now {self.battery_level}%)")
+        self._dirty = True
+        logger.info(f"Battery charged! Gained {gained}% (now {self.battery_level}%)")
     
     def expand_grid(self, new_width: int, new_height: int):
         """Manually expand the grid"""
         if new_width < self.grid_width or new_height < self.grid_height:
             raise InvalidCommandError("Cannot shrink grid size")
-        
+
+        old_width = self.grid_width
         self.grid_width = new_width
         self.grid_height = new_height
-        print(f"Grid expanded to {self.grid_width}x{self.grid_height}")
+        self._remap_obstacles(old_width)
+        self._dirty = True
+        self._base_cells = None
+        logger.info(f"Grid expanded to {self.grid_width}x{self.grid_height}")
     
     def reset(self):
         """Reset robot to initial position and state"""
         self.x = 0
         self.y = 0
-        self.direction = Direction.NORTH
+        self.dir = 0
         self.battery_level = 100
-        self.obstacles.clear()
+        self.obstacle_mask = 0
+        self.obstacle_count = 0
         self.command_history.clear()
         self.move_count = 0
-        print("Robot reset to initial state")
+        self._cmd_tick = 0
+        self._dirty = True
+        self._base_cells = None
+        logger.info("Robot reset to initial state")
     
-    def show_grid(self):
-        """Display a visual representation of the grid"""
-        print("\n=== GRID VISUALIZATION ===")
+    def _rebuild_base_cells(self):
+        """Rebuild the cached cell strings (empty/obstacle) for rendering"""
+        mask = self.obstacle_mask
+        self._base_cells = [
+            _CELL_OBSTACLE if mask >> i & 1 else _CELL_EMPTY
+            for i in range(self.grid_width * self.grid_height)
+        ]
+
+    def render_grid(self) -> str:
+        """Build a visual representation of the grid as a string"""
+        if self._base_cells is None:
+            self._rebuild_base_cells()
+
+        # Copy the cached base grid and stamp only the robot's cell;
+        # obstacles change far less often than the robot moves
+        width = self.grid_width
+        cells = self._base_cells.copy()
+        cells[self.y * width + self.x] = _CELL_ROBOT[self.dir]
+
+        lines = ["", "=== GRID VISUALIZATION ==="]
         for y in range(self.grid_height - 1, -1, -1):  # Top to bottom
-            row = ""
-            for x in range(self.grid_width):
-                if x == self.x and y == self.y:
-                    # Robot position with direction indicator
-                    direction_symbols = {
-                        Direction.NORTH: "↑",
-                        Direction.EAST: "→",
-                        Direction.SOUTH: "↓",
-                        Direction.WEST: "←"
-                    }
-                    row += f" {direction_symbols[self.direction]} "
-                elif (x, y) in self.obstacles:
-                    row += " # "  # Obstacle
-                else:
-                    row += " . "  # Empty space
-            print(f"{y:2d} |{row}|")
-        
+            base = y * width
+            lines.append(f"{y:2d} |{''.join(cells[base:base + width])}|")
+
         # X-axis labels
-        x_labels = "   "
-        for x in range(self.grid_width):
-            x_labels += f" {x} "
-        print(x_labels)
-        print("========================\n")
+        lines.append("   " + "".join(f" {x} " for x in range(width)))
+        lines.append("========================\n")
+        return "\n".join(lines)
+
+    def show_grid(self):
+        """Display a visual representation of the grid"""
+        print(self.render_grid())
     
+    # --- command handlers (dispatch targets for execute_command) ---
+
+    def _h_forward(self, parts):
+        self.forward(int(parts[1]) if len(parts) > 1 else 1)
+
+    def _h_left(self, parts):
+        self.left()
+
+    def _h_right(self, parts):
+        self.right()
+
+    def _h_diagonal(self, parts):
+        if len(parts) < 2:
+            raise InvalidCommandError("Diagonal command requires direction")
+        self.diagonal(parts[1])
+
+    def _h_report(self, parts):
+        self.report()
+
+    def _h_charge(self, parts):
+        self.charge_battery(int(parts[1]) if len(parts) > 1 else 50)
+
+    def _h_grid(self, parts):
+        # Through the logger, not stdout: the grid command arrives over
+        # HTTP too, and the CLI shows INFO messages already
+        logger.info(self.render_grid())
+
+    def _h_reset(self, parts):
+        self.reset()
+
+    def _h_obstacle(self, parts):
+        if len(parts) < 3:
+            raise InvalidCommandError("Obstacle command requires x y coordinates")
+        self.add_obstacle(int(parts[1]), int(parts[2]))
+
+    # Command verbs (synonyms included) mapped to handlers, built once at
+    # class creation so dispatch is a single dict lookup.
+    _DISPATCH = {
+        "forward": _h_forward, "f": _h_forward,
+        "left": _h_left, "l": _h_left,
+        "right": _h_right, "r": _h_right,
+        "diagonal": _h_diagonal, "d": _h_diagonal,
+        "report": _h_report,
+        "charge": _h_charge,
+        "grid": _h_grid,
+        "reset": _h_reset,
+        "obstacle": _h_obstacle,
+    }
+
     def execute_command(self, command: str):
         """
         Execute a command string.
-        
+
         Args:
             command: Command string to execute
         """
         try:
-            command = command.strip().lower()
-            parts = command.split()
-            
-            if not parts:
-                raise InvalidCommandError("Empty command")
-            
-            cmd = parts[0]
-            self.command_history.append(command)
-            
-            if cmd == "forward" or cmd == "f":
-                steps = int(parts[1]) if len(parts) > 1 else 1
-                self.forward(steps)
-            elif cmd == "left" or cmd == "l":
-                self.left()
-            elif cmd == "right" or cmd == "r":
-                self.right()
-            elif cmd == "diagonal" or cmd == "d":
-                if len(parts) < 2:
-                    raise InvalidCommandError("Diagonal command requires direction")
-                self.diagonal(parts[1])
-            elif cmd == "report":
-                self.report()
-            elif cmd == "charge":
-                amount = int(parts[1]) if len(parts) > 1 else 50
-                self.charge_battery(amount)
-            elif cmd == "grid":
-                self.show_grid()
-            elif cmd == "reset":
-                self.reset()
-            elif cmd == "obstacle":
-                if len(parts) >= 3:
-                    x, y = int(parts[1]), int(parts[2])
-                    self.add_obstacle(x, y)
-                else:
-                    raise InvalidCommandError("Obstacle command requires x y coordinates")
-            else:
-                raise InvalidCommandError(f"Unknown command: {cmd}")
-                
+            parts = _parse(command)
+
+            # History records the command as sent; state changes stay
+            # outside the cached parse path.
+            self.command_history.append(command.strip())
+
+            handler = self._DISPATCH.get(parts[0])
+            if handler is None:
+                raise InvalidCommandError(f"Unknown command: {parts[0]}")
+            handler(self, parts)
+
+            # Ambient battery drain: every 10th command costs 1%. A plain
+            # counter matches the old 10% random drain over long runs
+            # without an RNG call per command.
+            self._cmd_tick = (self._cmd_tick + 1) % 10
+            if self._cmd_tick == 0 and self.battery_level > 0:
+                self.battery_level -= 1
+                self._dirty = True
+
         except (ValueError, IndexError) as e:
             error_msg = f"Invalid command format: {command}"
-            print(f"Error: {error_msg}")
+            logger.info(f"Error: {error_msg}")
             raise InvalidCommandError(error_msg)
         except RobotSimulatorError:
             # Re-raise simulator-specific errors
             raise
         except Exception as e:
-            print(f"Unexpected error: {e}")
+            logger.warning(f"Unexpected error: {e}")
             raise RobotSimulatorError(f"Unexpected error: {e}")
 
 def interactive_mode():
@@ -408,12 +565,9 @@ def interactive_mode():
             
             if command:
                 robot.execute_command(command)
-                
-                # Random battery drain for realism
-                if random.random() < 0.1:  # 10% chance
-                    robot.battery_level = max(0, robot.battery_level - 1)
-                    if robot.battery_level <= 20:
-                        print(f"Warning: Low battery ({robot.battery_level}%)")
+
+                if robot.battery_level <= 20:
+                    print(f"Warning: Low battery ({robot.battery_level}%)")
         
         except RobotSimulatorError as e:
             print(f"Simulator Error: {e}")
@@ -461,6 +615,9 @@ def demo_mode():
     print("\nDemo completed!")
 
 if __name__ == "__main__":
+    # CLI usage keeps the informational messages visible
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     print("Robot Simulator Options:")
     print("1. Interactive Mode")
     print("2. Demo Mode")